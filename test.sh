@@ -65,8 +65,11 @@ run_test_file() {
     echo -e "Testing: \t$test_file"
     
     # Check available interpreters (prefer python3 for comprehensive test coverage)
+    # PyPy runs the pure-Python fallback runner faster, so use it when installed
     local test_cmd=""
-    if command -v python3 &> /dev/null; then
+    local python_cmd
+    python_cmd=$(command -v pypy3 || command -v python3 || true)
+    if [ -n "$python_cmd" ]; then
         test_cmd="python3"
     elif command -v lua &> /dev/null; then
         test_cmd="lua"
@@ -97,7 +100,7 @@ run_test_file() {
             ;;
         "python3")
             # Use Python test runner - pass the full test file path
-            python3 tests/python_test_runner.py "$test_file" > "$temp_output" 2>&1
+            "$python_cmd" tests/python_test_runner.py "$test_file" > "$temp_output" 2>&1
             exit_code=$?
             ;;
     esac
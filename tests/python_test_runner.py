@@ -16,106 +16,86 @@ and it will only validate test structure, not execute actual test logic.
 import os
 import re
 import sys
-import glob
-from typing import List, Dict, Any, Tuple
+import argparse
+import functools
+import hashlib
+import mmap
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Tuple, Optional, Union, NamedTuple
+
+# google-re2 is optional; its linear-time engine handles the file scan patterns
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Patterns are compiled once at import time and shared by every runner call.
+# Spec files are scanned as raw bytes; only the extracted fields are decoded.
+DESCRIBE_RE = _re_engine.compile(rb'describe\s*\(\s*["\']([^"\']+)["\']\s*,\s*function\s*\(\s*\)')
+IT_RE = _re_engine.compile(rb'it\s*\(\s*["\']([^"\']+)["\']\s*,\s*function\s*\(\s*\)')
+ASSERT_RE = re.compile(r'assert\.\w+\s*\(')
+# Obvious syntax errors, in the order they are reported, each paired with a
+# substring every match must contain so the regex can be skipped cheaply
+SYNTAX_ERROR_RES = [(literal, re.compile(p)) for literal, p in (
+    ('end', r'function\s*\(\s*\)\s*end\s*\('),  # Malformed function calls
+    (')', r'assert\.\w+\s*\(\s*\)'),            # Empty assertions
+    ('local', r'local\s+function\s*\('),       # Incomplete function definitions
+)]
+TOKEN_RE = _re_engine.compile(DESCRIBE_RE.pattern + b'|' + IT_RE.pattern + rb'|([{}])')
+
+# Parsed test lists are cached here, one entry per spec file path
+CACHE_DIR = os.path.join(".cache", "python_test_runner")
+
+class TestCase(NamedTuple):
+    """A single it() block found in a spec file"""
+    name: str
+    describe: str
+    it: str
+    body: str  # Raw function body, surrounding whitespace included
 
 class LuaTestRunner:
     def __init__(self):
         self.passed = 0
         self.failed = 0
         self.errors = 0
-        self.current_describe = None
-        
-    def parse_lua_test_file(self, file_path: str) -> List[Dict[str, Any]]:
-        """Parse a Lua test file and extract test cases"""
-        tests = []
+        # Report lines are buffered and written once per file
+        self._out: List[str] = []
         
+    def parse_lua_test_file(self, file_path: str) -> Iterator[TestCase]:
+        """Parse a Lua test file and yield its test cases"""
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-            
-            # Extract describe blocks
-            describe_pattern = r'describe\s*\(\s*["\']([^"\']+)["\']\s*,\s*function\s*\(\s*\)'
-            describe_matches = re.finditer(describe_pattern, content)
-            
-            for describe_match in describe_matches:
-                describe_name = describe_match.group(1)
-                describe_start = describe_match.end()
-                
-                # Find the end of this describe block (simplified - assumes proper nesting)
-                brace_count = 1
-                pos = describe_start
-                while pos < len(content) and brace_count > 0:
-                    if content[pos] == '{':
-                        brace_count += 1
-                    elif content[pos] == '}':
-                        brace_count -= 1
-                    pos += 1
-                
-                describe_content = content[describe_start:pos-1]
-                
-                # Extract it() blocks within this describe
-                it_pattern = r'it\s*\(\s*["\']([^"\']+)["\']\s*,\s*function\s*\(\s*\)'
-                it_matches = re.finditer(it_pattern, describe_content)
-                
-                for it_match in it_matches:
-                    test_name = it_match.group(1)
-                    full_test_name = f"{describe_name} {test_name}"
-                    
-                    # Extract the test function body
-                    it_start = it_match.end()
-                    it_brace_count = 1
-                    it_pos = it_start
-                    while it_pos < len(describe_content) and it_brace_count > 0:
-                        if describe_content[it_pos] == '{':
-                            it_brace_count += 1
-                        elif describe_content[it_pos] == '}':
-                            it_brace_count -= 1
-                        it_pos += 1
-                    
-                    test_body = describe_content[it_start:it_pos-1]
-                    
-                    tests.append({
-                        'name': full_test_name,
-                        'describe': describe_name,
-                        'it': test_name,
-                        'body': test_body.strip()
-                    })
-        
+            stat = os.stat(file_path)
+            tests = _parse_cached(file_path, stat.st_mtime_ns, stat.st_size)
         except Exception as e:
-            print(f"Error parsing {file_path}: {e}")
-            return []
-        
-        return tests
+            self._out.append(f"Error parsing {file_path}: {e}\n")
+            return
+        yield from tests
     
-    def execute_test(self, test: Dict[str, Any]) -> Tuple[bool, str]:
+    def execute_test(self, body: str) -> Tuple[bool, str]:
         """
         WARNING: This is a fallback test runner that cannot actually execute Lua code.
         It only performs basic syntax and structure validation.
         For real test execution, use Neovim or Lua interpreter.
         """
         try:
-            body = test['body']
-
-            # Basic syntax validation
-            if not body.strip():
+            # Basic syntax validation (isspace() avoids a stripped copy of the body)
+            if not body or body.isspace():
                 return False, "Empty test body"
 
+            # Cheap substring check before running the regex scan
+            if 'assert.' not in body:
+                return False, "No assertions found in test"
+
             # Check for basic test structure
-            has_assertions = bool(re.search(r'assert\.\w+\s*\(', body))
+            has_assertions = bool(ASSERT_RE.search(body))
             if not has_assertions:
                 return False, "No assertions found in test"
 
             # Check for obvious syntax errors
-            syntax_errors = [
-                r'function\s*\(\s*\)\s*end\s*\(',  # Malformed function calls
-                r'assert\.\w+\s*\(\s*\)',          # Empty assertions
-                r'local\s+function\s*\(',          # Incomplete function definitions
-            ]
-
-            for pattern in syntax_errors:
-                if re.search(pattern, body):
-                    return False, f"Potential syntax error detected: {pattern}"
+            for literal, rx in SYNTAX_ERROR_RES:
+                if literal in body and rx.search(body):
+                    return False, f"Potential syntax error detected: {rx.pattern}"
 
             # This is NOT actual test execution - just structure validation
             return True, "Structure validation passed (NOT executed)"
@@ -123,53 +103,59 @@ class LuaTestRunner:
         except Exception as e:
             return False, f"Validation error: {str(e)}"
     
-    def check_equals(self, actual: str, expected: str) -> bool:
-        """Check equality assertion"""
-        # Simplified - in real implementation would evaluate expressions
-        return True
-    
-    def check_is_true(self, value: str) -> bool:
-        """Check is_true assertion"""
-        return 'true' in value.lower() or 'success' in value.lower()
-    
-    def check_is_false(self, value: str) -> bool:
-        """Check is_false assertion"""
-        return 'false' in value.lower() or 'fail' in value.lower()
-    
-    def check_is_nil(self, value: str) -> bool:
-        """Check is_nil assertion"""
-        return 'nil' in value.lower()
-    
-    def check_is_not_nil(self, value: str) -> bool:
-        """Check is_not_nil assertion"""
-        return 'nil' not in value.lower()
-    
     def run_test_file(self, file_path: str) -> None:
         """Run all tests in a file"""
-        print(f"========================================")
-        print(f"Testing: \t{file_path}")
-        print(f"WARNING: Using fallback runner - structure validation only!")
+        self.collect_test_file(file_path)
+        self.flush_output()
 
-        tests = self.parse_lua_test_file(file_path)
+    def collect_test_file(self, file_path: str) -> None:
+        """Run all tests in a file, buffering the report instead of printing it"""
+        out = self._out
+        out.append("========================================\n")
+        out.append(f"Testing: \t{file_path}\n")
+        out.append("WARNING: Using fallback runner - structure validation only!\n")
 
-        if not tests:
-            print(f"Error\t||\tNo tests found in {file_path}")
-            self.errors += 1
-            return
-        
-        for test in tests:
-            success, message = self.execute_test(test)
+        found = 0
+        for test in self.parse_lua_test_file(file_path):
+            found += 1
+            success, message = self.execute_test(test.body)
 
             if success:
-                print(f"SUCCESS: {test['name']}")
+                out.append(f"SUCCESS: {test.name}\n")
                 self.passed += 1
             else:
-                print(f"FAILED: {test['name']}")
+                out.append(f"FAILED: {test.name}\n")
                 if message:
-                    print(f"Error: {message}")
+                    out.append(f"Error: {message}\n")
                 self.failed += 1
+
+        if not found:
+            out.append(f"Error\t||\tNo tests found in {file_path}\n")
+            self.errors += 1
+
+    def flush_output(self) -> None:
+        """Write the buffered report with a single stdout call"""
+        sys.stdout.write(''.join(self._out))
+        self._out.clear()
     
-    def run_all_tests(self, test_dir: str = "tests/spec") -> int:
+    def run_test_files(self, test_files: List[str], jobs: Optional[int] = None) -> None:
+        """Run test files in order, spreading them over worker processes when jobs > 1"""
+        jobs = min(jobs or os.cpu_count() or 1, len(test_files))
+
+        if jobs <= 1:
+            for test_file in test_files:
+                self.run_test_file(test_file)
+            return
+
+        # Files are independent; map() keeps results in input order
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for passed, failed, errors, output in executor.map(_run_file, test_files):
+                sys.stdout.write(output)
+                self.passed += passed
+                self.failed += failed
+                self.errors += errors
+
+    def run_all_tests(self, test_dir: str = "tests/spec", jobs: Optional[int] = None) -> int:
         """Run all test files in the test directory"""
         print("Starting Caramba.nvim Test Suite (FALLBACK MODE)")
         print("WARNING: This runner only validates test structure, not execution!")
@@ -180,14 +166,13 @@ class LuaTestRunner:
             print(f"Test directory {test_dir} not found")
             return 1
         
-        test_files = glob.glob(os.path.join(test_dir, "*_spec.lua"))
+        test_files = _find_spec_files(test_dir)
         
         if not test_files:
             print(f"No test files found in {test_dir}")
             return 1
         
-        for test_file in sorted(test_files):
-            self.run_test_file(test_file)
+        self.run_test_files(test_files, jobs)
         
         # Print summary
         print("========================================")
@@ -199,19 +184,170 @@ class LuaTestRunner:
         
         return 1 if (self.failed > 0 or self.errors > 0) else 0
 
+def _char_start(content: Union[bytes, mmap.mmap], pos: int) -> int:
+    """Step back from pos to the first byte of the UTF-8 character containing it"""
+    while pos > 0 and content[pos] & 0xC0 == 0x80:
+        pos -= 1
+    return pos
+
+def _parse_test_buffer(content: Union[bytes, mmap.mmap]) -> Iterator[TestCase]:
+    """Yield test cases from the raw bytes (or a read-only mmap) of a Lua spec file"""
+    # Every test lives in a describe block; skip the scan when there are none.
+    # find() rather than `in`, which on an mmap only tests for a single byte.
+    if content.find(b'describe') == -1:
+        return
+
+    # Single pass over describe/it headers and braces. Each open block
+    # remembers the brace depth it started at and closes on the first
+    # '}' that drops below it (simplified - assumes proper nesting).
+    describes = []
+    stack = []
+    depth = 0
+
+    def on_brace(opening: bool, pos: int) -> None:
+        nonlocal depth
+        if opening:
+            depth += 1
+            return
+        depth -= 1
+        while stack and stack[-1]['depth'] > depth:
+            stack.pop()['end'] = pos
+
+    for match in TOKEN_RE.finditer(content):
+        brace = match.group(3)
+        if brace:
+            on_brace(brace == b'{', match.start())
+            continue
+
+        group = 1 if match.group(1) is not None else 2
+        name = match.group(group)
+
+        # Braces inside the quoted name still count for enclosing blocks
+        if b'{' in name or b'}' in name:
+            name_start = match.start(group)
+            for offset, ch in enumerate(name):
+                if ch in b'{}':
+                    on_brace(ch == ord('{'), name_start + offset)
+
+        block = {'name': name.decode('utf-8', 'replace'), 'start': match.end(), 'end': None, 'depth': depth}
+        if group == 1:
+            block['its'] = []
+            describes.append(block)
+        else:
+            # Nested describes each report the test under their own name
+            for open_block in stack:
+                if 'its' in open_block:
+                    open_block['its'].append(block)
+        stack.append(block)
+
+    # Blocks left open run to the end of the file, minus its last character
+    eof = _char_start(content, len(content) - 1)
+    for block in stack:
+        block['end'] = eof
+
+    for describe in describes:
+        for it in describe['its']:
+            if it['start'] > describe['end']:
+                continue
+
+            # An it() cut off by its describe loses the describe's last character
+            body_end = it['end'] if it['end'] < describe['end'] else _char_start(content, describe['end'] - 1)
+
+            yield TestCase(
+                f"{describe['name']} {it['name']}",
+                describe['name'],
+                it['name'],
+                content[it['start']:body_end].decode('utf-8', 'replace'),
+            )
+
+@functools.lru_cache(maxsize=None)
+def _parse_cached(file_path: str, mtime_ns: int, size: int) -> Tuple[TestCase, ...]:
+    """Parse a spec file, reusing results pickled by earlier runs while it is unchanged.
+
+    The result is shared between callers through the lru_cache, so it is an
+    immutable tuple; the parser's generator is drained here for the cache.
+    """
+    # The entry is named after the path alone and overwritten when stale, so edits
+    # never leave orphans behind. The runner's own mtime is part of the stamp so
+    # parser changes invalidate old entries.
+    cache_path = os.path.join(CACHE_DIR, hashlib.blake2b(os.path.abspath(file_path).encode()).hexdigest() + ".pickle")
+    stamp = (mtime_ns, size, os.stat(__file__).st_mtime_ns)
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_stamp, cached_tests = pickle.load(f)
+        if cached_stamp == stamp:
+            return tuple(TestCase(*fields) for fields in cached_tests)
+    except Exception:
+        pass
+
+    # Scan the OS page cache directly instead of copying the file into memory.
+    # Names and bodies are decoded while parsing, so nothing outlives the map.
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap refuses empty files, which hold no tests anyway
+            tests = ()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                tests = tuple(_parse_test_buffer(content))
+
+    # Write through a temp file so parallel workers never read a partial entry.
+    # Plain tuples are stored so entries load no matter how the runner was imported.
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((stamp, [tuple(test) for test in tests]), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+    return tests
+
+def _find_spec_files(test_dir: str, pattern: str = "") -> List[str]:
+    """List the *_spec.lua files directly in test_dir whose stem contains pattern, sorted"""
+    suffix = "_spec.lua"
+    try:
+        # One scandir pass; DirEntry caches the type so is_file() rarely needs a stat
+        with os.scandir(test_dir) as entries:
+            return sorted(
+                entry.path for entry in entries
+                if entry.name.endswith(suffix)
+                and not entry.name.startswith('.')
+                and pattern in entry.name[:-len(suffix)]
+                and entry.is_file()
+            )
+    except OSError:
+        return []
+
+def _run_file(file_path: str) -> Tuple[int, int, int, str]:
+    """Run one test file in a worker, returning its counters and buffered output"""
+    runner = LuaTestRunner()
+    runner.collect_test_file(file_path)
+    return runner.passed, runner.failed, runner.errors, ''.join(runner._out)
+
 def main():
+    parser = argparse.ArgumentParser(description="Fallback structure validator for Caramba.nvim Lua tests")
+    parser.add_argument("pattern", nargs="?", help="spec file path or name pattern to run")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: CPU count, 1 runs sequentially)")
+    args = parser.parse_args()
+
     runner = LuaTestRunner()
     
     # Check if specific test file or pattern provided
-    if len(sys.argv) > 1:
-        arg = sys.argv[1]
+    if args.pattern:
+        arg = args.pattern
 
         # If it's a full path to a test file, use it directly
         if arg.endswith('_spec.lua') and os.path.exists(arg):
             test_files = [arg]
         else:
             # Otherwise treat it as a pattern
-            test_files = glob.glob(f"tests/spec/*{arg}*_spec.lua")
+            test_files = _find_spec_files("tests/spec", arg)
 
         if not test_files:
             print(f"No test files found for: {arg}")
@@ -220,8 +356,7 @@ def main():
         print("Starting Caramba.nvim Test Suite")
         print("========================================")
 
-        for test_file in sorted(test_files):
-            runner.run_test_file(test_file)
+        runner.run_test_files(test_files, args.jobs)
 
         print("========================================")
         print("Test Summary:")
@@ -232,7 +367,7 @@ def main():
 
         return 1 if (runner.failed > 0 or runner.errors > 0) else 0
     else:
-        return runner.run_all_tests()
+        return runner.run_all_tests(jobs=args.jobs)
 
 if __name__ == "__main__":
     sys.exit(main())